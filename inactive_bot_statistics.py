@@ -42,6 +42,7 @@ import pymysql
 import pywikibot
 import logging
 import re
+from utils import convert_numerals, format_date
 
 # Configuration Parameters
 site_lang = 'ckb'  # Language code for the target site
@@ -74,27 +75,6 @@ try:
         charset='utf8'
     )
 
-    # Define a function to convert numerals to Eastern Arabic numerals
-    def convert_numerals(text):
-        eastern_arabic_numerals = {
-            '0': '٠', '1': '١', '2': '٢', '3': '٣', '4': '٤', '5': '٥', '6': '٦', '7': '٧', '8': '٨', '9': '٩'
-        }
-        return ''.join(eastern_arabic_numerals[char] if char in eastern_arabic_numerals else char for char in text)
-
-    # Define a function to format a date with the desired format and optional link
-    def format_date(date, link=None):
-        months = {
-            'January': 'کانوونی دووەم', 'February': 'شوبات', 'March': 'ئازار', 'April': 'نیسان', 'May': 'ئایار', 'June': 'حوزەیران',
-            'July': 'تەممووز', 'August': 'ئاب', 'September': 'ئەیلوول', 'October': 'تشرینی یەکەم', 'November': 'تشرینی دووەم', 'December': 'کانوونی یەکەم'
-        }
-
-        date_parts = date.split()
-        formatted_date = f'{convert_numerals(date_parts[2])}ی {months[date_parts[1]]}ی {convert_numerals(date_parts[0])}'
-        if link:
-            return f'[[{link}|{formatted_date}]]'
-        else:
-            return formatted_date
-
     cursor = connection.cursor()
     cursor.execute("USE ckbwiki_p;")
 
@@ -103,14 +83,19 @@ try:
         SELECT
             actor_name AS Username,
             MAX(rev_timestamp) AS LastEditTimestamp,
-            COUNT(rev_id) AS NumberOfEdits,
-            GROUP_CONCAT(DISTINCT actor_user_groups.ug_group) AS BotGroups,
+            user_editcount AS NumberOfEdits,  -- Cached counter; avoids counting every revision
+            bot_groups.BotGroups,
             user_registration AS RegistrationTimestamp
         FROM revision
         JOIN actor ON actor_id = rev_actor
         JOIN user ON actor_user = user_id
-        LEFT JOIN user_groups AS actor_user_groups ON user_id = actor_user_groups.ug_user
-        WHERE actor_user_groups.ug_group LIKE '%bot%'
+        JOIN (
+            -- One row per bot with its distinct, sorted bot groups
+            SELECT ug_user, GROUP_CONCAT(ug_group ORDER BY ug_group SEPARATOR ', ') AS BotGroups
+            FROM user_groups
+            WHERE ug_group LIKE '%bot%'
+            GROUP BY ug_user
+        ) AS bot_groups ON user_id = bot_groups.ug_user
         GROUP BY Username
         HAVING LastEditTimestamp < DATE_FORMAT(NOW() - INTERVAL 30 DAY, '%Y%m%d%H%i%s') -- Change '30 DAY' to the desired inactivity threshold
     )
@@ -118,10 +103,10 @@ try:
     SELECT
         ROW_NUMBER() OVER (ORDER BY LastEditTimestamp ASC) AS '#',
         Username,
-        DATE_FORMAT(LastEditTimestamp, '%Y %M %e') AS LastEditDate,
+        DATE(LastEditTimestamp) AS LastEditDate,  -- Returned as a native date, no string parsing needed
         NumberOfEdits,
         BotGroups,
-        DATE_FORMAT(RegistrationTimestamp, '%Y %M %e') AS RegistrationDate
+        DATE(RegistrationTimestamp) AS RegistrationDate
     FROM InactiveBotsData
     ORDER BY LastEditTimestamp ASC;
     """
@@ -131,7 +116,7 @@ try:
     decoded_results = []
 
     for row in results:
-        decoded_row = [item.decode('utf-8') if isinstance(item, bytes) else str(item) for item in row]
+        decoded_row = [item.decode('utf-8') if isinstance(item, bytes) else item for item in row]
         decoded_results.append(decoded_row)
 
     cursor.close()
@@ -158,15 +143,19 @@ try:
         table += "|-\n"
         table += "! # !! بەکارھێنەر !! دوایین دەستکاری !! ژمارەی دەستکارییەکان !! مافەکان !! ڕێکەوتی خۆتۆمارکردن\n"
 
-        for row in decoded_results:
-            rank, username, last_edit_date, num_edits, bot_groups, reg_date = row
-            rank = convert_numerals(str(rank))
-            num_edits = convert_numerals(str(num_edits))
-            last_edit_date = format_date(last_edit_date, link=f'تایبەت:بەشدارییەکان/{username}')
-            reg_date = format_date(reg_date)
-
-            table += "|-\n"
-            table += f"| {rank} || [[بەکارھێنەر:{username}|{username}]] || {last_edit_date} || {num_edits} || {bot_groups} || {reg_date}\n"
+        # Build all rows from a single template in one pass
+        row_template = "|-\n| {rank} || [[بەکارھێنەر:{username}|{username}]] || {last_edit_date} || {num_edits} || {bot_groups} || {reg_date}\n"
+        table += ''.join(
+            row_template.format(
+                rank=convert_numerals(str(rank)),
+                username=username,
+                last_edit_date=format_date(last_edit_date, link=f'تایبەت:بەشدارییەکان/{username}'),
+                num_edits=convert_numerals(str(num_edits)),
+                bot_groups=bot_groups,
+                reg_date=format_date(reg_date) if reg_date else '',
+            )
+            for rank, username, last_edit_date, num_edits, bot_groups, reg_date in decoded_results
+        )
 
         table += "|}\n"
         table += '\n[[پۆل:ڕاپۆرتی بنکەدراوەی ویکیپیدیا]]'
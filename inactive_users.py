@@ -92,9 +92,9 @@ def main():
         SELECT
           ROW_NUMBER() OVER (ORDER BY last_edit.last_edit_date DESC) AS row_number,
           user_name,
-          DATE_FORMAT(user_registration, '%Y %M %e') AS user_registration,
+          DATE(user_registration) AS user_registration,  -- Returned as a native date, no string parsing needed
           user_editcount,
-          DATE_FORMAT(last_edit.last_edit_date, '%Y %M %e') AS last_edit_date,
+          DATE(last_edit.last_edit_date) AS last_edit_date,
           IFNULL(GROUP_CONCAT(ug_group), '') AS groups
         FROM
           user
@@ -132,7 +132,7 @@ def main():
         decoded_results = []
 
         for row in results:
-            decoded_row = [item.decode('utf-8') if isinstance(item, bytes) else str(item) for item in row]
+            decoded_row = [item.decode('utf-8') if isinstance(item, bytes) else item for item in row]
             decoded_results.append(decoded_row)
 
         cursor.close()
@@ -161,16 +161,19 @@ def main():
             table += "|-\n"
             table += "! # !! بەکارھێنەر !! ژمارەی دەستکارییەکان !! ڕێکەوتی خۆتۆمارکردن !! دوایین دەستکاری !! مافەکان\n"
 
-            for row in decoded_results:
-                row_number, username, reg_date, num_edits, last_edit_date, groups = row
-                row_number = convert_numerals(str(row_number))
-                username_link = f"[[بەکارھێنەر:{username}|{username}]]"
-                num_edits = convert_numerals(str(num_edits))
-                reg_date = format_date(reg_date)
-                last_edit_date = format_date(last_edit_date, link=f'تایبەت:بەشدارییەکان/{username}')
-
-                table += "|-\n"
-                table += f"| {row_number} || {username_link} || {num_edits} || {reg_date} || {last_edit_date} || {groups}\n"
+            # Build all rows from a single template in one pass
+            row_template = "|-\n| {row_number} || [[بەکارھێنەر:{username}|{username}]] || {num_edits} || {reg_date} || {last_edit_date} || {groups}\n"
+            table += ''.join(
+                row_template.format(
+                    row_number=convert_numerals(str(row_number)),
+                    username=username,
+                    num_edits=convert_numerals(str(num_edits)),
+                    reg_date=format_date(reg_date) if reg_date else '',
+                    last_edit_date=format_date(last_edit_date, link=f'تایبەت:بەشدارییەکان/{username}') if last_edit_date else '',
+                    groups=groups,
+                )
+                for row_number, username, reg_date, num_edits, last_edit_date, groups in decoded_results
+            )
 
             table += "|}\n"
 
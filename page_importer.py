@@ -22,6 +22,14 @@ but it's better to avoid it because the generated permanent link may be incorrec
 The script does not currently adjust the link format for cross-project imports.
 """
 
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import pywikibot
 
 # Configuration variables
@@ -29,6 +37,16 @@ SOURCE_WIKI_LANG = "en"
 SOURCE_WIKI_PROJECT = "wiktionary"
 DEST_WIKI_LANG = "ckb"
 DEST_WIKI_PROJECT = "wiktionary"
+MAX_WORKERS = 8  # Pages processed concurrently; keep it small to respect the wikis' throttling
+
+# Local cache of (wiki, title) -> Wikidata item, kept between runs in pywikibot's base directory
+CACHE_FILE_NAME = 'page_importer_cache.sqlite'
+ITEM_CACHE_TTL = 24 * 60 * 60  # Re-check the Wikidata item of a page after a day (seconds)
+
+# Wikidata items (with their sitelinks) loaded in bulk before the import starts, keyed by QID
+preloaded_items = {}
+
+cache_lock = threading.Lock()
 
 # List of page titles to import with optional corresponding destination titles
 page_titles = [
@@ -36,24 +54,77 @@ page_titles = [
     ("Category:Zulu language", "پۆل:زمانی زوولوو"), # Import under different title
 ]
 
-def import_page(source_site, destination_site, source_page_title, destination_page_title=None):
-    '''Import the latest version of page(s) from the source wiki to the destination wiki'''
-    
-    # Use source title if destination title is not provided
-    destination_page_title = destination_page_title or source_page_title
-    # Get the source page
-    source_page = pywikibot.Page(source_site, source_page_title)
+@lru_cache(maxsize=None)
+def wikidata_repo():
+    '''Return the Wikidata repository, looked up once for the whole run'''
+    return pywikibot.Site("wikidata", "wikidata").data_repository()
+
+@lru_cache(maxsize=None)
+def cache_db():
+    '''Return the connection to the local cache, opened (and created if needed) on first use'''
+    db = sqlite3.connect(os.path.join(pywikibot.config.base_dir, CACHE_FILE_NAME), check_same_thread=False)
+    db.execute('CREATE TABLE IF NOT EXISTS wikidata_items (wiki TEXT, title TEXT, qid TEXT, ts INTEGER, PRIMARY KEY (wiki, title))')
+    db.execute('CREATE TABLE IF NOT EXISTS imported (wiki TEXT, title TEXT, src_rev_id INTEGER, digest BLOB, PRIMARY KEY (wiki, title))')
+    return db
+
+@lru_cache(maxsize=None)
+def site_dbname(site):
+    '''Return the database name of a site, computed once per site'''
+    return site.dbName()
+
+@lru_cache(maxsize=None)
+def site_data_repository(site):
+    '''Return the Wikibase repository of a site, looked up once per site'''
+    return site.data_repository()
+
+def text_digest(text):
+    '''Return a short fingerprint of a page text'''
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+def import_status(source_page, destination_page):
+    '''Return (synced, recorded): whether the destination page was last synced to the current source
+    revision or content, and whether the stored row already holds the current source revision'''
+    with cache_lock:
+        row = cache_db().execute('SELECT src_rev_id, digest FROM imported WHERE wiki = ? AND title = ?',
+                                 (site_dbname(destination_page.site), destination_page.title())).fetchone()
+    if not row:
+        return False, False
+    src_rev_id, digest = row
+    if src_rev_id == source_page.latest_revision_id:
+        return True, True
+    # The digest catches new source revisions with unchanged text (e.g. null edits or self-reverts)
+    return digest == text_digest(source_page.text), False
+
+def remember_import(source_page, destination_page):
+    '''Record that the destination page matches the current source revision'''
+    with cache_lock:
+        cache_db().execute('INSERT OR REPLACE INTO imported VALUES (?, ?, ?, ?)',
+                           (site_dbname(destination_page.site), destination_page.title(),
+                            source_page.latest_revision_id, text_digest(source_page.text)))
+        cache_db().commit()
+
+def import_page(source_page, destination_page, status):
+    '''Import the latest version of a (preloaded) source page to the destination wiki, given its import_status()'''
+    source_page_title = source_page.title()
+    destination_page_title = destination_page.title()
 
     # Check if the page exists on the source wiki
     if not source_page.exists():
-        print(f"Page '{source_page_title}' does not exist on the source wiki.")
+        pywikibot.warning(f"Page '{source_page_title}' does not exist on the source wiki.")
         return
 
-    source_text = source_page.text
     source_rev_id = source_page.latest_revision_id  # Get the latest revision ID
 
-    # Get the destination page
-    destination_page = pywikibot.Page(destination_site, destination_page_title)
+    # Nothing changed upstream since the last import, and the imported page is still there
+    synced, recorded = status
+    if synced and destination_page.exists():
+        pywikibot.info(f"Page '{destination_page_title}' is already up-to-date. Skipping...")
+        # Only store the new source revision when the text matched by its digest
+        if not recorded:
+            remember_import(source_page, destination_page)
+        return destination_page
+
+    source_text = source_page.text
 
     # Construct the permanent link for the edit summary
     source_permalink = f"[[:{SOURCE_WIKI_LANG}:Special:PermanentLink/{source_rev_id}|{SOURCE_WIKI_LANG}:{source_page_title}]]"
@@ -63,66 +134,97 @@ def import_page(source_site, destination_site, source_page_title, destination_pa
         destination_text = destination_page.text
         # Check if the text is already up-to-date
         if destination_text == source_text:
-            print(f"Page '{destination_page_title}' is already up-to-date. Skipping...")
+            pywikibot.info(f"Page '{destination_page_title}' is already up-to-date. Skipping...")
+            remember_import(source_page, destination_page)
             return destination_page
         else:
             # Text is different, update it
-            print(f"Updating existing page '{destination_page_title}' on the destination wiki...")
+            pywikibot.info(f"Updating existing page '{destination_page_title}' on the destination wiki...")
             try:
                 destination_page.text = source_text
                 destination_page.save(summary=f"بۆت: نوێکردنەوەی ناوەڕۆک بەپێی {source_permalink}")
-                print(f"Page '{destination_page_title}' updated successfully.")
+                pywikibot.info(f"Page '{destination_page_title}' updated successfully.")
+                remember_import(source_page, destination_page)
                 return destination_page
             except Exception as e:
-                print(f"Failed to update page '{destination_page_title}': {e}")
+                pywikibot.error(f"Failed to update page '{destination_page_title}': {e}")
                 return None
     else:
         # Page does not exist, create it
-        print(f"Creating new page '{destination_page_title}' on the destination wiki...")
+        pywikibot.info(f"Creating new page '{destination_page_title}' on the destination wiki...")
         try:
             destination_page.text = source_text
             destination_page.save(summary=f"بۆت: لە {source_permalink} ھاوردە کرا")
-            print(f"Page '{destination_page_title}' imported successfully.")
+            pywikibot.info(f"Page '{destination_page_title}' imported successfully.")
+            remember_import(source_page, destination_page)
             return destination_page
         except Exception as e:
-            print(f"Failed to import page '{destination_page_title}': {e}")
+            pywikibot.error(f"Failed to import page '{destination_page_title}': {e}")
             return None
 
-def handle_wikidata(page, source_page_title, destination_page_title=None):
-    '''Handle Wikidata connections for a given page'''
-    # Function to handle Wikidata connection for a given page
-    destination_page_title = destination_page_title or source_page_title  # Use source title if destination title is not provided
-    source_wiki_page = pywikibot.Page(pywikibot.Site(SOURCE_WIKI_LANG, SOURCE_WIKI_PROJECT), source_page_title)
-    dest_wiki_page = pywikibot.Page(pywikibot.Site(DEST_WIKI_LANG, DEST_WIKI_PROJECT), destination_page_title)
+def remember_data_item(page, qid):
+    '''Store the Wikidata item of a page in the cache ('' means the page has no item)'''
+    with cache_lock:
+        cache_db().execute('INSERT OR REPLACE INTO wikidata_items VALUES (?, ?, ?, ?)',
+                           (site_dbname(page.site), page.title(), qid, int(time.time())))
+        cache_db().commit()
+
+def cached_data_item(page):
+    '''Like page.data_item(), but answered from the local cache or the page props, without loading the item'''
+    with cache_lock:
+        row = cache_db().execute('SELECT qid, ts FROM wikidata_items WHERE wiki = ? AND title = ?',
+                                 (site_dbname(page.site), page.title())).fetchone()
+    # Items can be merged, deleted or added on Wikidata, so cached answers expire
+    if row and time.time() - row[1] < ITEM_CACHE_TTL:
+        qid = row[0]
+        if qid:
+            return preloaded_items.get(qid) or pywikibot.ItemPage(site_data_repository(page.site), qid)
+        raise pywikibot.exceptions.NoPageError(page)
+
+    # The item id comes from the preloaded page props, so no Wikidata request is made here;
+    # preload_items() then loads all the items in batches
+    qid = page.properties().get('wikibase_item', '')
+    remember_data_item(page, qid)
+    if not qid:
+        raise pywikibot.exceptions.NoPageError(page)
+    return preloaded_items.get(qid) or pywikibot.ItemPage(site_data_repository(page.site), qid)
+
+def handle_wikidata(dest_wiki_page, source_wiki_page):
+    '''Handle Wikidata connections for an imported page and its source page'''
+    # Reuse the pages from the import so their already loaded data is not fetched again
+    source_page_title = source_wiki_page.title()
+    destination_page_title = dest_wiki_page.title()
 
     # Check if the source wiki page has a Wikidata item
     try:
-        source_wiki_item = source_wiki_page.data_item()
+        source_wiki_item = cached_data_item(source_wiki_page)
         if source_wiki_item:
-            print(f"Found existing Wikidata item '{source_wiki_item.title()}' for '{source_page_title}' on the source wiki.")
+            pywikibot.info(f"Found existing Wikidata item '{source_wiki_item.title()}' for '{source_page_title}' on the source wiki.")
 
             # Add Central Kurdish sitelink to the existing item
-            if not source_wiki_item.sitelinks.get(dest_wiki_page.site.dbName()):
+            if not source_wiki_item.sitelinks.get(site_dbname(dest_wiki_page.site)):
                 source_wiki_item.setSitelink(dest_wiki_page, summary=f"Adding {DEST_WIKI_LANG} sitelink: {destination_page_title}")
-                print(f"Page '{destination_page_title}' connected to existing Wikidata item '{source_wiki_item.title()}'.")
+                remember_data_item(dest_wiki_page, source_wiki_item.getID())
+                pywikibot.info(f"Page '{destination_page_title}' connected to existing Wikidata item '{source_wiki_item.title()}'.")
             else:
-                print(f"Page '{destination_page_title}' already connected to existing Wikidata item '{source_wiki_item.title()}'.")
+                pywikibot.info(f"Page '{destination_page_title}' already connected to existing Wikidata item '{source_wiki_item.title()}'.")
             return source_wiki_item
     except pywikibot.exceptions.NoPageError:
         pass
 
     # Check if the destination wiki page has a Wikidata item
     try:
-        dest_wiki_item = dest_wiki_page.data_item()
+        dest_wiki_item = cached_data_item(dest_wiki_page)
         if dest_wiki_item:
-            print(f"Found existing Wikidata item '{dest_wiki_item.title()}' for '{destination_page_title}' on the destination wiki.")
+            pywikibot.info(f"Found existing Wikidata item '{dest_wiki_item.title()}' for '{destination_page_title}' on the destination wiki.")
 
             # Add English sitelink to the existing item
-            if not dest_wiki_item.sitelinks.get(source_wiki_page.site.dbName()):
+            if not dest_wiki_item.sitelinks.get(site_dbname(source_wiki_page.site)):
                 dest_wiki_item.setSitelink(source_wiki_page, summary=f"Adding {SOURCE_WIKI_LANG} sitelink: {source_page_title}")
-                print(f"Page '{source_page_title}' connected to existing Wikidata item '{dest_wiki_item.title()}'.")
+                remember_data_item(source_wiki_page, dest_wiki_item.getID())
+                pywikibot.info(f"Page '{source_page_title}' connected to existing Wikidata item '{dest_wiki_item.title()}'.")
             else:
-                print(f"Page '{source_page_title}' already connected to existing Wikidata item '{dest_wiki_item.title()}'.")
+                pywikibot.info(f"Page '{source_page_title}' already connected to existing Wikidata item '{dest_wiki_item.title()}'.")
             return dest_wiki_item
     except pywikibot.exceptions.NoPageError:
         pass
@@ -130,40 +232,76 @@ def handle_wikidata(page, source_page_title, destination_page_title=None):
     # Check if the page is a redirect
     if dest_wiki_page.isRedirectPage():
         # Redirect page already exists and should not create a new Wikidata item
-        print(f"Page '{destination_page_title}' is a redirect. No new Wikidata item created.")
+        pywikibot.info(f"Page '{destination_page_title}' is a redirect. No new Wikidata item created.")
         return None
 
     # If no existing Wikidata item found and not a redirect page, create a new one and add both sitelinks
-    print("Creating a new Wikidata item...")
+    pywikibot.info("Creating a new Wikidata item...")
     try:
-        site = pywikibot.Site("wikidata", "wikidata")
-        repo = site.data_repository()
-        new_item = pywikibot.ItemPage(repo)
+        new_item = pywikibot.ItemPage(wikidata_repo())
         
-        # Connect the destination wiki site links
-        new_item.setSitelink(dest_wiki_page, summary=f"Adding {DEST_WIKI_LANG} sitelink: {destination_page_title}")
-        new_item.setSitelink(source_wiki_page, summary=f"Adding {SOURCE_WIKI_LANG} sitelink: {source_page_title}")
+        # Create the item with both sitelinks in a single wbeditentity call
+        new_item.editEntity(
+            {'sitelinks': [dest_wiki_page, source_wiki_page]},
+            summary=f"Adding {DEST_WIKI_LANG} and {SOURCE_WIKI_LANG} sitelinks: {destination_page_title}, {source_page_title}")
+        remember_data_item(dest_wiki_page, new_item.getID())
+        remember_data_item(source_wiki_page, new_item.getID())
 
-        print(f"Page '{destination_page_title}' connected to new Wikidata item '{new_item.title()}'.")
+        pywikibot.info(f"Page '{destination_page_title}' connected to new Wikidata item '{new_item.title()}'.")
         return new_item
     except Exception as e:
-        print(f"Error creating or editing Wikidata item: {e}")
+        pywikibot.error(f"Error creating or editing Wikidata item: {e}")
         return None
 
+def preload(pages, content=True):
+    '''Fetch text (unless content is False), revision info and page props for the given pages in batches instead of one request per page'''
+    if pages:
+        # Page props include the Wikidata item id, so cached_data_item() needs no extra request
+        for _ in pages[0].site.preloadpages(pages, groupsize=50, pageprops=True, content=content):
+            pass
+
+def preload_items(pages):
+    '''Load the Wikidata items of the given pages with a single wbgetentities call per 50 items'''
+    items = []
+    for page in pages:
+        try:
+            items.append(cached_data_item(page))
+        except pywikibot.exceptions.NoPageError:
+            pass
+    for item in wikidata_repo().preload_entities(items, groupsize=50):
+        preloaded_items[item.getID()] = item
+
+def process_page(source_page, destination_page, status):
+    '''Import a single page and connect it to Wikidata'''
+    pywikibot.info(f"\n\nProcessing page '{source_page.title()}' with destination title '{destination_page.title()}':")
+    page = import_page(source_page, destination_page, status)
+    if page:
+        handle_wikidata(page, source_page)
+
 def main():
     source_site = pywikibot.Site(SOURCE_WIKI_LANG, SOURCE_WIKI_PROJECT)
     destination_site = pywikibot.Site(DEST_WIKI_LANG, DEST_WIKI_PROJECT)
-    
-    for item in page_titles:
-        if isinstance(item, tuple):
-            source_title, dest_title = item
-        else:
-            source_title = dest_title = item
-        print("\n")
-        print(f"Processing page '{source_title}' with destination title '{dest_title}':")
-        page = import_page(source_site, destination_site, source_title, dest_title)
-        if page:
-            handle_wikidata(page, source_title, dest_title)
+
+    # Normalize the entries to (source title, destination title) pairs, dropping duplicates
+    title_pairs = list(dict.fromkeys(item if isinstance(item, tuple) else (item, item) for item in page_titles))
+    source_pages = [pywikibot.Page(source_site, source_title) for source_title, _ in title_pairs]
+    destination_pages = [pywikibot.Page(destination_site, dest_title) for _, dest_title in title_pairs]
+
+    preload(source_pages)
+    preload_items([source_page for source_page in source_pages if source_page.exists()])
+    # Look up the import status of each pair once; import_page reuses it
+    statuses = [import_status(source_page, destination_page) if source_page.exists() else (False, False)
+                for source_page, destination_page in zip(source_pages, destination_pages)]
+    # Only fetch the text of destination pages whose source changed since it was last imported;
+    # for the others, the page info is enough to tell that they still exist
+    preload([destination_page for source_page, destination_page, (synced, _) in zip(source_pages, destination_pages, statuses)
+             if source_page.exists() and not synced])
+    preload([destination_page for destination_page, (synced, _) in zip(destination_pages, statuses) if synced],
+            content=False)
+
+    # The work is I/O bound, so overlap the network round-trips of several pages
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        list(executor.map(process_page, source_pages, destination_pages, statuses))
 
 if __name__ == "__main__":
     main()
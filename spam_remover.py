@@ -43,40 +43,94 @@ class SpamRemoverBot(
         'domain': None,  # spam domain must be provided
     }
 
-    def treat_page(self) -> None:
-        """Load the given page, remove spam references, and save it."""
-        text = self.current_page.text
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
 
-        # Get the spam domain and replacement text from the options
-        spam_domain = self.opt.domain
-        replace_text = self.opt.replace
-        summary_reason = self.opt.reason
+        escaped_domain = re.escape(self.opt.domain)
+        self.domain_lower = self.opt.domain.lower()
 
         # Define a combined pattern to match unnamed and named references with optional name capture
-        refs_pattern = re.compile(
-            r'<ref(?:\s+name="([^"]+)")?[^>]*>[^<]*?' + re.escape(spam_domain) + r'[^<]*?</ref>',
+        self.refs_pattern = re.compile(
+            r'<ref(?:\s+name="([^"]+)")?[^>]*>[^<]*?' + escaped_domain + r'[^<]*?</ref>',
             re.IGNORECASE | re.DOTALL
         )
 
-        # Find all matches of the combined pattern
-        matches = refs_pattern.findall(text)
-        
-        # Extract names from matches, if present
-        named_refs = set(name for name in matches if name)
+        # Pattern matching any <ref name="NAME" /> as well as the spam references, so reuses
+        # of the named spam references are replaced in the same pass. Whether a reused name
+        # belongs to a spam reference is checked against a set, not built into the pattern.
+        self.combined_refs_pattern = re.compile(
+            r'<ref\s+name="([^"]+)"[^>]*?/>|' + self.refs_pattern.pattern,
+            re.IGNORECASE | re.DOTALL
+        )
 
-        # Create a pattern to match <ref name="NAME" /> where NAME is in the set of named_refs
-        if named_refs:
-            names_pattern = re.compile(r'<ref\s+name="(' + '|'.join(re.escape(name) for name in named_refs) + r')"[^>]*?/>', re.IGNORECASE)
-            new_text = names_pattern.sub(replace_text, text)
-        else:
-            new_text = text
+    def remove_spam_lines(self, text):
+        """
+        Remove lines with external links containing the spam domain, along with
+        the blank lines right after them. The last line is only removed by the
+        reference patterns, as it has no line break of its own.
+        """
+        # Nothing to filter when the references were the only mentions of the domain
+        if self.domain_lower not in text.lower():
+            return text
+
+        lines = text.split('\n')
+        kept_lines = []
+        skip_blank_lines = False
+        for line in lines[:-1]:
+            if skip_blank_lines and not line:
+                continue
+            skip_blank_lines = self.domain_lower in line.lower()
+            if not skip_blank_lines:
+                kept_lines.append(line)
+        kept_lines.append(lines[-1])
+        return '\n'.join(kept_lines)
 
-        # Replace all unnamed references containing the spam domain with the replacement text
-        new_text = refs_pattern.sub(replace_text, new_text)
+    def treat_page(self) -> None:
+        """Load the given page, remove spam references, and save it."""
+        text = self.current_page.text
+        lowered_text = text.lower()
+
+        # Skip all pattern work on pages that don't mention the domain at all
+        if self.domain_lower not in lowered_text:
+            pywikibot.info("No changes made to the page.")
+            return
+
+        # Get the spam domain and replacement text from the options
+        spam_domain = self.opt.domain
+        replace_text = self.opt.replace
+        summary_reason = self.opt.reason
 
-        # Also, remove lines with external links containing the spam domain
-        external_link_pattern = re.compile(r'\*?.*?\[?.*?' + re.escape(spam_domain) + r'.*?\]?.*?\n+', re.IGNORECASE)
-        new_text = external_link_pattern.sub('', new_text)
+        new_text = text
+
+        # The reference patterns can only match on pages with <ref> tags
+        if '<ref' in lowered_text:
+            # Scan the page once, collecting both the spam references and every
+            # self-closing <ref name="NAME" /> that might reuse one of them
+            matches = list(self.combined_refs_pattern.finditer(text))
+
+            # Extract names from the spam references, if present (names are matched case-insensitively)
+            named_refs = set(match.group(2).lower() for match in matches if match.group(2))
+
+            # Only the spam references, and reuses of the named ones, are replaced
+            replaced_matches = [match for match in matches
+                                if match.group(1) is None or match.group(1).lower() in named_refs]
+
+            # Assemble the new text from the spans between the replaced matches; skipped
+            # entirely when the domain only appears outside references
+            if replaced_matches:
+                parts = []
+                position = 0
+                for match in replaced_matches:
+                    parts.append(text[position:match.start()])
+                    parts.append(replace_text)
+                    position = match.end()
+                parts.append(text[position:])
+                new_text = ''.join(parts)
+
+        # Also, remove lines with external links containing the spam domain.
+        # This runs after the references are replaced, so lines that only cited
+        # the domain inside a reference are kept.
+        new_text = self.remove_spam_lines(new_text)
 
         # Check if the page text has changed
         if new_text != text:
@@ -85,7 +139,7 @@ class SpamRemoverBot(
             summary = default_summary + "؛ " + summary_reason
             self.put_current(new_text, summary=summary)
         else:
-            print("No changes made to the page.")
+            pywikibot.info("No changes made to the page.")
 
 
 def main(*args: str) -> None:
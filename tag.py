@@ -10,7 +10,8 @@ at least one tag is added or removed, preventing purely cosmetic changes.
 Operational Flow:
 1.  Initialization: On startup, the bot performs a one-time data fetch from
     Wikidata for ~170 layout templates, tags and their redirects, displaying
-    a progress bar. This data is cached for the duration of the run.
+    a progress bar. This data is cached on disk (per wiki) for a day, so
+    later runs start without fetching it again.
 2.  Page Processing: The bot processes pages only within the article namespace,
     automatically skipping disambiguation pages.
 3.  Editing Logic: Each article is parsed into a header, sections, and a
@@ -72,19 +73,58 @@ from pywikibot.bot import (
     ExistingPageBot,
     SingleSiteBot,
 )
+import json
+import os
 import re
-import string
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 
 from tag_data import (
     TAG_DEFINITIONS, SUMMARY_MESSAGES, MULTIPLE_ISSUES_QID, LIVING_PEOPLE_CATEGORY_QID,
-    CITATION_TEMPLATES_QIDS, ALL_TAGS_BY_PRIORITY, LAYOUT_TEMPLATES_BY_PRIORITY,
+    CITATION_TEMPLATES_QIDS, ALL_TAGS_BY_PRIORITY, LAYOUT_TEMPLATES_BY_PRIORITY, TAG_PRIORITY_INDEX,
 )
 
 TAGS_TITLES = {}
 
+MAX_INIT_WORKERS = 8  # Concurrent API requests while fetching template data on startup
+
+PROGRESS_BAR_LEN = 40  # Width of the progress bar, sliced from the strings below on each update
+PROGRESS_BAR_FILLED = '=' * PROGRESS_BAR_LEN
+PROGRESS_BAR_EMPTY = '-' * PROGRESS_BAR_LEN
+
+# On-disk cache of the template data fetched on startup, kept between runs.
+TEMPLATE_CACHE_VERSION = 1  # Bump when the cached data format changes
+TEMPLATE_CACHE_TTL = 24 * 60 * 60  # Refetch the template data after a day (seconds)
+
 yes_no_mapping = {True: "Yes", False: "No"}
 
+# Tags whose conditions depend on the number of references (and on whether the page is a BLP).
+SOURCE_TAGS = frozenset({'blp_unreferenced', 'unreferenced', 'blp_one_source', 'one_source'})
+
+# Extracts the name of a template from its wikitext (e.g., "Orphan" from "{{Orphan|date=...}}").
+TEMPLATE_NAME_REGEX = re.compile(r'{{\s*([^|}]+)')
+
+# Finds the individual tags inside the content of a {{Multiple issues}} block.
+MI_INNER_TAG_REGEX = re.compile(r'\{\{.*?\}\}', re.DOTALL)
+
+def title_pattern(title):
+    """Return a regex pattern for a template title, matching spaces and underscores alike as MediaWiki does."""
+    return re.escape(title).replace(r'\ ', '[ _]')
+
+def title_key(title):
+    """Return the lookup key of a template title found in wikitext: lowercase, with underscores as spaces."""
+    return title.replace('_', ' ').strip().lower()
+
+@lru_cache(maxsize=None)
+def get_summary_messages(language):
+    """Return the summary messages for a language, falling back to English for missing ones."""
+    msgs = SUMMARY_MESSAGES['en'].copy()
+    msgs.update(SUMMARY_MESSAGES.get(language, {}))
+    return msgs
+
 # This is required for the text that is shown when you run this script
 # with the parameter -help.
 docuReplacements = {'&params;': pagegenerators.parameterHelp}  # noqa: N816
@@ -117,15 +157,17 @@ class TagBot(
             sys.exit(1)
 
         pywikibot.info("Initializing bot: Fetching and caching template data...")
+        self._last_progress_pct = -1  # State used by _update_progress() to throttle redraws
+        self._last_progress_time = 0.0
 
         # Compile a master list of all QIDs to fetch.
         tag_qids = list(ALL_TAGS_BY_PRIORITY.values())
-        all_qids = list(set(tag_qids + CITATION_TEMPLATES_QIDS +
-                            LAYOUT_TEMPLATES_BY_PRIORITY + [MULTIPLE_ISSUES_QID] +
-                            [LIVING_PEOPLE_CATEGORY_QID]))
+        all_qids = list(dict.fromkeys(tag_qids + CITATION_TEMPLATES_QIDS +
+                                      LAYOUT_TEMPLATES_BY_PRIORITY + [MULTIPLE_ISSUES_QID] +
+                                      [LIVING_PEOPLE_CATEGORY_QID]))
         
-        # Fetch all titles from Wikidata in a single, efficient API call.
-        all_titles = self._fetch_titles_from_wikidata(all_qids, self.site.code)
+        # Fetch all titles from Wikidata and the redirects of the templates (or load them from the cache).
+        all_titles, redirects_by_title = self._load_template_data(all_qids)
 
         # Distribute fetched titles into their respective groups.
         tags_titles = {name: all_titles.get(qid) for name, qid in ALL_TAGS_BY_PRIORITY.items()}
@@ -140,52 +182,97 @@ class TagBot(
             pywikibot.warning(f"Could not find 'Living people' category for {self.site.code}wiki. BLP tagging will be disabled.")
 
         TAGS_TITLES[self.site.code] = {k: v for k, v in tags_titles.items() if v}
-        self.tag_order = list(ALL_TAGS_BY_PRIORITY.keys())
 
-        # Initialize the progress bar with a more readable calculation.
-        total_items = (len(tags_titles) + len(citation_titles) +
-                    len(layout_titles_by_qid) + 1)  # +1 for {{Multiple issues}}
-        processed_items = 0
-
-        # Fetch redirects for each group of templates.
+        # Distribute the redirects into their template groups.
         # Maintenance Tags
-        self.tag_redirects = {}
-        for name, title in tags_titles.items():
-            redirects, processed_items = self._fetch_redirects_with_progress(
-                [title], processed_items, total_items, "Fetching tag redirects")
-            self.tag_redirects[name] = redirects
-
-        # Fetch redirects for other template groups.
-        self.mi_templates, processed_items = self._fetch_redirects_with_progress(
-            [self.multiple_issues_title], processed_items, total_items, "Fetching {{Multiple issues}} redirects")
+        self.tag_redirects = {name: redirects_by_title.get(title, []) for name, title in tags_titles.items()}
 
-        all_citation_redirects, processed_items = self._fetch_redirects_with_progress(
-            citation_titles, processed_items, total_items, "Fetching citation redirects")
+        # Other template groups.
+        self.mi_templates = redirects_by_title.get(self.multiple_issues_title, [])
+        all_citation_redirects = [t for title in citation_titles for t in redirects_by_title[title]]
 
         # Layout Templates (passed to _process_layout_templates)
-        self.layout_templates_by_qid, processed_items = self._process_layout_templates(layout_titles_by_qid, processed_items, total_items)
+        self.layout_templates_by_qid = self._process_layout_templates(layout_titles_by_qid, redirects_by_title)
 
         # Compile final regex patterns from the fetched redirect lists.
+        # All of them are case-insensitive as a whole, which already covers MediaWiki's
+        # case-insensitive first letter, so titles are just escaped (see title_pattern()).
+
+        # Build the alternation of each tag's titles once; it's shared by the tag regexes below.
+        self.tag_title_patterns = {name: '|'.join(title_pattern(t) for t in red_list)
+                                   for name, red_list in self.tag_redirects.items() if red_list}
+
         if self.mi_templates:
-            self.mi_templates_pattern = '|'.join(self.case_insensitive_first_letter(t) for t in self.mi_templates)
+            self.mi_templates_pattern = '|'.join(title_pattern(t) for t in self.mi_templates)
         else:
             self.mi_templates_pattern = None
             pywikibot.warning(f"Could not find {{Multiple issues}} template for {self.site.code}wiki. Tag wrapping logic will be disabled.")
 
+        # Compile a single regex to count references in one pass over the text. In order of preference:
+        # - 'self_closing': <ref name="..."/> tags, which have no content of their own.
+        # - 'ref': content-filled <ref>...</ref> or <ref name="...">...</ref> tags (case-sensitive).
+        # - 'ref_block': any other <ref ...>...</ref> block, skipped like the ones above.
+        # - 'citation': a citation template outside of all <ref> tags.
+        # The first and third must not start at a <references> tag, or they would swallow a list-defined ref.
+        references_pattern = (r'(?P<self_closing><ref(?!erences)[^>]*?/>)'
+                              r'|(?P<ref>(?-i:<ref(?: name="[^"]*")?\s*>.*?</ref>))'
+                              r'|(?P<ref_block><ref(?!erences).*?</ref>)')
         if all_citation_redirects:
-            pattern = '|'.join(self.case_insensitive_first_letter(t) for t in set(all_citation_redirects))
-            # Compile a regex to find any citation template in the text.
-            self.citation_templates_regex = re.compile(
-                r'\{\{\s*(' + pattern + r')(?:\s*\|.*?)?\}\}', re.IGNORECASE | re.DOTALL)
-        else:
-            self.citation_templates_regex = None
+            pattern = '|'.join(title_pattern(t) for t in dict.fromkeys(all_citation_redirects))
+            references_pattern += r'|(?P<citation>\{\{\s*(' + pattern + r')(?:\s*\|.*?)?\}\})'
+        self.references_regex = re.compile(references_pattern, re.IGNORECASE | re.DOTALL)
+
+        # Compile one regex matching any tag, to find all tags present on a page in a single scan.
+        all_tag_titles = [t for red_list in self.tag_redirects.values() for t in red_list]
+        self.tag_presence_regex = self._create_tag_regex('|'.join(self.tag_title_patterns.values())) if all_tag_titles else None
+
+        # Compile one regex to gather the {{Multiple issues}} block and all standalone top tags from the
+        # header in a single pass. The 'uncategorized' tag is handled separately at the bottom of the page.
+        top_tags_patterns = []
+        if self.mi_templates_pattern:
+            # A robust regex to find {{mi}} and safely separate its components.
+            # It handles named parameters (e.g., |section=yes) before or after the tag content.
+            # It also handles VisualEditor's explicit |1= for the tag content.
+            # mi_opening: `{{Multiple issues|section=yes|` or `{{Multiple issues|1=`
+            # mi_content: The maintenance tags themselves
+            # mi_closing: `|collapsed=yes}}`
+            top_tags_patterns.append(
+                r"(?P<mi>(?s:"
+                r"(?P<mi_opening>\{\{(?:" + self.mi_templates_pattern + r")\s*"  # Start of template
+                r"(?:\|(?:(?!1=)[^=}|]+=[^|}]*))*\s*\|(?:1=)?\s*)"  # Named params before & pipe
+                r"(?P<mi_content>(?:\{\{.*?\}\}\s*)*?)"  # The actual tags (non-greedy)
+                r"(?P<mi_closing>\s*(?:\|[^=}|]+=[^|}]*)*\}\})"  # Named params after & close
+                r"))"
+            )
+        top_tag_patterns = [pattern for name, pattern in self.tag_title_patterns.items() if name != 'uncategorized']
+        if top_tag_patterns:
+            top_tags_patterns.append(
+                r"(?P<tag>\{\{(?P<tag_name>" + "|".join(top_tag_patterns) + r")(?:\s*\|.*?)*?\s*\}\})"
+            )
+        self.top_tags_regex = re.compile('|'.join(top_tags_patterns), re.IGNORECASE) if top_tags_patterns else None
 
         # Create a reverse mapping from redirect to canonical tag name (canonical names themselves included).
         self.redirect_to_canonical = {r.lower(): can for can, red_list in self.tag_redirects.items() for r in red_list}
 
+        # Compile one regex matching any maintenance tag (with its parameters) for tag removal.
+        # Longer titles come first so a title is never cut short by another title that is its prefix.
+        if all_tag_titles:
+            pattern = '|'.join(title_pattern(t) for t in sorted(set(all_tag_titles), key=len, reverse=True))
+            self.tag_removal_regex = re.compile(
+                r"\{\{\s*(" + pattern + r")\s*\|?(?:\{\{.*?\}\}|[^\{\}])*?\}\}\n?", re.IGNORECASE)
+        else:
+            self.tag_removal_regex = None
+
+        # Merge the site-specific overrides into the default configuration of every tag once.
+        default_configs = TAG_DEFINITIONS.get('default', {})
+        site_overrides = TAG_DEFINITIONS.get(self.site.code, {})
+        self.tag_configs = {
+            name: {**default_configs.get(name, {}), **site_overrides.get(name, {})}
+            for name in {**default_configs, **site_overrides}
+        }
+
         # Prepare language-specific summary messages.
-        self.summary_msgs = SUMMARY_MESSAGES['en'].copy()
-        self.summary_msgs.update(SUMMARY_MESSAGES.get(self.site.code, {}))
+        self.summary_msgs = get_summary_messages(self.site.code)
 
         # Clear the progress bar line.
         sys.stdout.write('\n')
@@ -196,120 +283,118 @@ class TagBot(
         if not self.is_page_eligible_for_edit(self.current_page):
             return
 
+        # Read the page text once; every helper below works on this copy.
+        text = self.current_page.text
+
+        # Find all tags already on the page in a single scan.
+        present_tags = self.find_present_tags(text)
+
         # Analyze the page to gather necessary data for tag conditions.
-        is_biography = self.is_blp(self.current_page)
-        total_refs, refs_in_tags, refs_no_tags = self.count_references(self.current_page.text)
-        num_links = self.count_internal_links(self.current_page)
-        is_orphan_page = self.is_orphan(self.current_page)
-        num_categories = self.count_visible_categories(self.current_page)
+        total_refs, refs_in_tags, refs_no_tags = self.count_references(text)
+
+        # With more than one reference, none of the source tags can be added. Unless one of them is
+        # already on the page (and may have to be removed), skip their checks and the BLP lookup.
+        check_source_tags = total_refs <= 1 or not present_tags.isdisjoint(SOURCE_TAGS)
+        is_biography, is_orphan_page, has_links = self.check_page_relations(
+            self.current_page, check_blp=check_source_tags)
+        num_categories = self.count_visible_categories(text)
 
         # Log the analysis results.
         pywikibot.info('- Page Analysis:')
-        pywikibot.info(f"{'    - Is BLP:':<25}{yes_no_mapping[is_biography]}")
+        pywikibot.info(f"{'    - Is BLP:':<25}{yes_no_mapping.get(is_biography, 'Not checked')}")
         pywikibot.info(f"{'    - Is Orphan:':<25}{yes_no_mapping[is_orphan_page]}")
-        pywikibot.info(f"{'    - Internal Links:':<25}{num_links}")
+        pywikibot.info(f"{'    - Has Internal Links:':<25}{yes_no_mapping[has_links]}")
         pywikibot.info(f"{'    - References:':<25}{total_refs} ({refs_in_tags} with <ref> tags, {refs_no_tags} without <ref> tags)")
         pywikibot.info(f"{'    - Categories:':<25}{num_categories}")
         pywikibot.info('-' * 20)
-        
+
         # Prepare lists to track tags to add or remove.
         tags_to_add = []
         tags_to_remove = []
 
-        # Define the checks to run along with their condition functions and parameters.
-        checks_to_run = [
-            ('blp_unreferenced', self._blp_unreferenced_conditions, is_biography, total_refs),
-            ('unreferenced', self._unreferenced_conditions, is_biography, total_refs),
-            ('blp_one_source', self._blp_one_source_conditions, is_biography, total_refs),
-            ('one_source', self._one_source_conditions, is_biography, total_refs),
-            ('deadend', self._deadend_conditions, num_links),
-            ('orphan', self._orphan_conditions, is_orphan_page),
-            ('uncategorized', self._uncategorized_conditions, num_categories),
-        ]
-
-        for tag_name, condition_func, *args in checks_to_run:
-            action, has_tag = self._check_tag(tag_name, condition_func, tags_to_add, tags_to_remove, *args)
-            
+        # Collect the analysis results the condition functions pick their parameters from.
+        analysis = {
+            'is_biography': is_biography,
+            'total_refs': total_refs,
+            'has_links': has_links,
+            'is_orphan_page': is_orphan_page,
+            'num_categories': num_categories,
+        }
+
+        for tag_name, condition_func in self.TAG_CHECKS:
             # Log the result in a padded format for better readability.
             padded_check = f'- Checking [{tag_name}]...'.ljust(35)
 
+            if tag_name in SOURCE_TAGS and not check_source_tags:
+                pywikibot.info(f'{padded_check}Status: SKIPPED')
+                continue
+
+            action, has_tag = self._check_tag(tag_name, condition_func, present_tags, tags_to_add, tags_to_remove, analysis)
+
             if has_tag is not None:
                 exists_str = f"Tag exists: {yes_no_mapping[has_tag]:<3}"  # Pad "No" to align output
                 pywikibot.info(f'{padded_check}{exists_str} | Action: {action}')
             else: # Handles CONFIG_MISSING or TEMPLATE_NOT_FOUND
                 pywikibot.info(f'{padded_check}Status: {action}')
 
-        self.edit_page(self.current_page, tags_to_add, tags_to_remove)
+        self.edit_page(self.current_page, text, tags_to_add, tags_to_remove)
 
-    def edit_page(self, page, tags_to_add, tags_to_remove):
+    def edit_page(self, page, oldtext, tags_to_add, tags_to_remove):
         # If there's no reason to edit, do nothing.
         if not tags_to_add and not tags_to_remove:
             pywikibot.info(f'No changes were needed on {page.title()}')
             return
 
-        oldtext = page.text
         newtext = oldtext
 
-        # Perform all removals on the full text first.
-        for tag in set(tags_to_remove):
-            pattern = r"\{\{\s*" + self.case_insensitive_first_letter(tag) + r"\s*\|?(?:\{\{.*?\}\}|[^\{\}])*?\}\}\n?"
-            newtext = re.sub(pattern, "", newtext, flags=re.IGNORECASE)
+        # Perform all removals on the full text first, in a single pass.
+        if tags_to_remove and self.tag_removal_regex:
+            # Only remove tags whose canonical name is being removed; keep any other matched tag.
+            removed_tag_names = {self.redirect_to_canonical.get(tag.lower()) for tag in tags_to_remove}
+            newtext = self.tag_removal_regex.sub(
+                lambda m: '' if self.redirect_to_canonical.get(title_key(m.group(1))) in removed_tag_names else m.group(0),
+                newtext)
 
         # Separate the MODIFIED text into parts.
         page_parts = extract_sections(newtext, self.site)
         header = page_parts.header
-        sections = "".join(s.title + s.content for s in page_parts.sections)
         footer = page_parts.footer
+        # The sections are everything between the header and the footer; slice them out
+        # instead of joining every section's title and content back together.
+        sections = newtext[len(header):len(newtext) - len(footer)]
 
         # Consolidate all existing top-level maintenance tags.
         all_top_tags_as_text = []
+        existing_tag_names = set()  # Canonical names of the tags gathered below
         mi_existed = False
         mi_opening, mi_closing = '', ''
 
-        # Only run the wrapping logic if the {{Multiple issues}} template exists on the wiki.
-        if self.mi_templates_pattern:
-
-            # A robust regex to find {{mi}} and safely separate its components.
-            # It handles named parameters (e.g., |section=yes) before or after the tag content.
-            # It also handles VisualEditor's explicit |1= for the tag content.
-            # Group 1 (opening): `{{Multiple issues|section=yes|` or `{{Multiple issues|1=`
-            # Group 2 (content): The maintenance tags themselves
-            # Group 3 (closing): `|collapsed=yes}}`
-            mi_template_regex = (
-                r"(\{\{(?:" + self.mi_templates_pattern + r")\s*"  # Start of template
-                r"(?:\|(?:(?!1=)[^=}|]+=[^|}]*))*\s*\|(?:1=)?\s*)"  # Named params before & pipe
-                r"((?:\{\{.*?\}\}\s*)*?)"  # Group 2: The actual tags (non-greedy)
-                r"(\s*(?:\|[^=}|]+=[^|}]*)*\}\})"  # Group 3: Named params after & close
-            )
-            
-            if mi_match := re.search(mi_template_regex, header, re.DOTALL | re.IGNORECASE):
-                mi_existed = True
-                mi_opening, content, mi_closing = mi_match.groups()
-                tags_inside_mi = re.findall(r'\{\{.*?\}\}', content, re.DOTALL)
-                all_top_tags_as_text.extend(t.strip() for t in tags_inside_mi)
-                header = header.replace(mi_match.group(0), '', 1)
-
-        # Gather all standalone maintenance tags, removing them from the header.
-        for tag_name in self.tag_redirects:
-            # The 'uncategorized' tag is handled separately at the bottom of the page.
-            if tag_name == 'uncategorized':
-                continue
-            
-            regex = self._create_tag_regex(tag_name)
-            if regex and (matches := list(regex.finditer(header))):
-                all_top_tags_as_text.extend(m.group(0) for m in matches)
-                header = regex.sub('', header)
+        # Gather the {{Multiple issues}} block and all standalone maintenance tags in a single
+        # scan of the header, and rebuild the header once from the spans around them.
+        if self.top_tags_regex:
+            remaining_parts = []
+            position = 0
+            for match in self.top_tags_regex.finditer(header):
+                remaining_parts.append(header[position:match.start()])
+                position = match.end()
+
+                if match.lastgroup == 'mi':
+                    # Keep the opening/closing parts of the first block to preserve its parameters;
+                    # the tags of any further blocks are merged into it.
+                    if not mi_existed:
+                        mi_existed = True
+                        mi_opening, mi_closing = match.group('mi_opening'), match.group('mi_closing')
+                    for tag_text in MI_INNER_TAG_REGEX.findall(match.group('mi_content')):
+                        all_top_tags_as_text.append(tag_text.strip())
+                        # Tags inside {{Multiple issues}} can be anything, so look up their names.
+                        existing_tag_names.add(self._get_canonical_tag_name(tag_text.strip()))
+                else:
+                    all_top_tags_as_text.append(match.group('tag'))
+                    existing_tag_names.add(self.redirect_to_canonical.get(title_key(match.group('tag_name'))))
+            remaining_parts.append(header[position:])
+            header = ''.join(remaining_parts)
 
         # Prepare new tags to be added, ensuring no duplicates.
-        existing_tag_names = set()
-        template_name_re = re.compile(r'{{\s*([^|}]+)')
-        for tag_text in all_top_tags_as_text:
-            if match := template_name_re.match(tag_text):
-                # Get the template name (e.g., "Orphaned") and look it up.
-                name = match.group(1).strip().lower()
-                if name in self.redirect_to_canonical:
-                    existing_tag_names.add(self.redirect_to_canonical[name])
-
         bottom_tags = ""
         for tag in tags_to_add:
             # This check is now extremely fast and does not use regex.
@@ -365,7 +450,7 @@ class TagBot(
     # Condition Logic
     # =========================================================================
 
-    def _check_tag(self, tag_name, condition_func, tags_to_add, tags_to_remove, *args):
+    def _check_tag(self, tag_name, condition_func, present_tags, tags_to_add, tags_to_remove, analysis):
         """
         Generic handler for checking a tag. It decides on an action and
         updates the add/remove lists. Returns the action taken and if the tag existed.
@@ -374,12 +459,11 @@ class TagBot(
         if not tag_conf:
             return "CONFIG_MISSING", None
 
-        regex = self._create_tag_regex(tag_name)
-        if not regex:
+        if not self.tag_redirects.get(tag_name):
             return "TEMPLATE_NOT_FOUND", None
 
-        has_tag = bool(regex.search(self.current_page.text))
-        should_add, should_remove = condition_func(has_tag, *args)
+        has_tag = tag_name in present_tags
+        should_add, should_remove = condition_func(self, has_tag, analysis)
         
         action = "NONE"
         if should_add and tag_conf.get("addable"):
@@ -391,94 +475,135 @@ class TagBot(
         
         return action, has_tag
 
-    def _unreferenced_conditions(self, has_tag, is_biography, num_refs):
+    def _unreferenced_conditions(self, has_tag, analysis):
         """Condition logic for the 'unreferenced' tag (non-BLP pages)."""
-        should_have_tag = (num_refs == 0 and not is_biography)
+        should_have_tag = (analysis['total_refs'] == 0 and not analysis['is_biography'])
         return (not has_tag and should_have_tag), (has_tag and not should_have_tag)
     
-    def _blp_unreferenced_conditions(self, has_tag, is_biography, num_refs):
+    def _blp_unreferenced_conditions(self, has_tag, analysis):
         """Condition logic for the 'BLP unreferenced' tag."""
-        should_have_tag = (num_refs == 0 and is_biography)
+        should_have_tag = (analysis['total_refs'] == 0 and analysis['is_biography'])
         return (not has_tag and should_have_tag), (has_tag and not should_have_tag)
 
-    def _one_source_conditions(self, has_tag, is_biography, num_refs):
+    def _one_source_conditions(self, has_tag, analysis):
         """Condition logic for the 'one source' tag (non-BLP pages)."""
-        should_have_tag = (num_refs == 1 and not is_biography)
+        should_have_tag = (analysis['total_refs'] == 1 and not analysis['is_biography'])
         return (not has_tag and should_have_tag), (has_tag and not should_have_tag)
 
-    def _blp_one_source_conditions(self, has_tag, is_biography, num_refs):
+    def _blp_one_source_conditions(self, has_tag, analysis):
         """Condition logic for the 'BLP one source' tag."""
-        should_have_tag = (num_refs == 1 and is_biography)
+        should_have_tag = (analysis['total_refs'] == 1 and analysis['is_biography'])
         return (not has_tag and should_have_tag), (has_tag and not should_have_tag)
 
-    def _deadend_conditions(self, has_tag, num_links):
+    def _deadend_conditions(self, has_tag, analysis):
         """Condition logic for the 'deadend' tag."""
-        return (not has_tag and num_links == 0), (has_tag and num_links != 0)
+        has_links = analysis['has_links']
+        return (not has_tag and not has_links), (has_tag and has_links)
 
-    def _orphan_conditions(self, has_tag, is_orphan_page):
+    def _orphan_conditions(self, has_tag, analysis):
         """Condition logic for the 'orphan' tag."""
+        is_orphan_page = analysis['is_orphan_page']
         return (not has_tag and is_orphan_page), (has_tag and not is_orphan_page)
 
-    def _uncategorized_conditions(self, has_tag, num_cats):
+    def _uncategorized_conditions(self, has_tag, analysis):
         """Condition logic for the 'uncategorized' tag."""
+        num_cats = analysis['num_categories']
         return (not has_tag and num_cats == 0), (has_tag and num_cats != 0)
+
+    # The checks to run on every page, along with their condition functions.
+    # Built once for the class; each condition picks its parameters from the page analysis.
+    TAG_CHECKS = (
+        ('blp_unreferenced', _blp_unreferenced_conditions),
+        ('unreferenced', _unreferenced_conditions),
+        ('blp_one_source', _blp_one_source_conditions),
+        ('one_source', _one_source_conditions),
+        ('deadend', _deadend_conditions),
+        ('orphan', _orphan_conditions),
+        ('uncategorized', _uncategorized_conditions),
+    )
     
     # =========================================================================
     # Data Analysis Helpers (Counters & Checkers)
     # =========================================================================
     
-    def is_blp(self, page):
+    def check_page_relations(self, page, check_blp=True):
         """
-        Check if the page is a biography of a living person by checking for
-        the canonical 'Living people' category.
+        Check if the page is a biography of a living person (by checking for the
+        canonical 'Living people' category), if it has no backlinks from other
+        articles, and if it links to at least one article, in a single API
+        request for most pages. Returns (is_biography, is_orphan_page, has_links),
+        where is_biography is None if check_blp is False.
         """
+        # A single backlink or link is enough to tell, so don't fetch the rest.
+        props = ['linkshere', 'links']
+        parameters = {
+            'action': 'query',
+            'titles': page.title(),
+            'lhnamespace': 0,
+            'lhshow': '!redirect',
+            'lhprop': 'pageid',
+            'lhlimit': 1,
+            'plnamespace': 0,
+            'pllimit': 1,
+            'formatversion': 2,
+        }
+
         # This safety check prevents a crash if the BLP category was not found.
-        if not self.living_people_cat_title:
-            return False
+        check_blp_category = check_blp and self.living_people_cat_title
+        if check_blp_category:
+            # Only ask whether the page is in the 'Living people' category, not for all its categories.
+            props.append('categories')
+            parameters['clcategories'] = pywikibot.Category(self.site, self.living_people_cat_title).title()
 
-        blp_cat_lower = self.living_people_cat_title.lower()
-        return any(cat.title(with_ns=False).lower() == blp_cat_lower
-                for cat in page.categories())
-    
-    def is_orphan(self, page):
-        """Check if the page has no backlinks from other articles."""
-        return len(list(page.backlinks(namespaces=0, filter_redirects=False))) == 0
-    
-    def count_internal_links(self, page):
-        """Count the number of internal links on the page."""
-        return len(list(page.linkedPages(namespaces=0)))
+        parameters['prop'] = '|'.join(props)
+        page_data = self.site.simple_request(**parameters).submit()['query']['pages'][0]
+
+        if check_blp_category:
+            is_biography = bool(page_data.get('categories'))
+        else:
+            is_biography = False if check_blp else None
+        # Links through a redirect don't show up in linkshere, so only a page without direct
+        # backlinks needs a second request, which follows the redirects to the page.
+        is_orphan_page = (not page_data.get('linkshere')
+                          and not any(page.backlinks(namespaces=0, filter_redirects=False, total=1)))
+        has_links = bool(page_data.get('links'))
+        return is_biography, is_orphan_page, has_links
 
     def count_references(self, text):
         """
         Count references by counting <ref> tags and citation templates that
         are not already inside a <ref> tag.
         """
-        # Count all unique, content-filled <ref> tags.
-        # Match <ref>...</ref> or <ref name="...">...</ref>, but NOT self-closing <ref ... />
-        refs = re.findall(r"<ref(?: name=\"[^\"]*\")?\s*>.*?</ref>", text, re.DOTALL)
-        num_refs = len(refs)
-
+        # Count all content-filled <ref> tags, and the citation templates outside of any <ref> block,
+        # in a single scan. Matched <ref> blocks are consumed, so citations inside them are not counted.
+        num_refs = 0
         num_citations = 0
-        if self.citation_templates_regex:
-            # Create a clean version of the text by removing all <ref> blocks,
-            # including self-closing ones like <ref name="..."/>
-            ref_block_regex = r"<ref(?:.|\n)*?</ref>|<ref[^>]*?/>"
-            text_without_refs = re.sub(ref_block_regex, "", text, flags=re.IGNORECASE)
-            
-            # Now, safely search for citation templates without <ref> tags in the clean text.
-            num_citations = len(self.citation_templates_regex.findall(text_without_refs))
+        for match in self.references_regex.finditer(text):
+            if match.lastgroup == 'ref':
+                num_refs += 1
+            elif match.lastgroup == 'citation':
+                num_citations += 1
 
         total_sources = num_refs + num_citations
         return total_sources, num_refs, num_citations
 
-    def count_visible_categories(self, page):
+    def find_present_tags(self, text):
+        """Return the canonical names of all maintenance tags found in the text."""
+        if not self.tag_presence_regex:
+            return set()
+        present_tags = {self.redirect_to_canonical.get(title_key(m.group(1))) for m in self.tag_presence_regex.finditer(text)}
+        present_tags.discard(None)
+        return present_tags
+
+    def count_visible_categories(self, text):
         """Count the number of non-hidden categories in the page wikitext."""
-        cats_in_text = getCategoryLinks(page.text, self.site)
+        cats_in_text = getCategoryLinks(text, self.site)
         if not cats_in_text:
             return 0
 
         # Batch-preload properties to check 'hidden' status efficiently.
-        preloaded_cats = self.site.preloadpages(cats_in_text, pageprops=True)
+        # Only page props are needed, so skip downloading the text of every category page.
+        preloaded_cats = self.site.preloadpages(cats_in_text, pageprops=True, content=False)
         
         non_hidden_categories = [cat for cat in preloaded_cats if not cat.isHiddenCategory()]
         num_categories = len(non_hidden_categories)
@@ -490,50 +615,82 @@ class TagBot(
 
     def handle_templates_above_top_tags(self, header):
         """Identify and sort layout templates above top tags based on predefined QID order."""
-        templates_above_tags = []
-        remaining_header = header
+        if not self.layout_qid_by_name:
+            return '', header
 
-        # Iterate by QID priority and extract matching templates from the header.
-        for qid in self.layout_templates_by_qid.keys():
-            pattern = self.qid_patterns.get(qid)
-            if not pattern:
-                continue
+        # Find all layout templates in a single scan.
+        templates = list(self.find_layout_templates(header))
+
+        # Rebuild the remaining header from the spans between the found templates.
+        remaining_parts = []
+        position = 0
+        for qid, start, end in templates:
+            remaining_parts.append(header[position:start])
+            position = end
+        remaining_parts.append(header[position:])
+        remaining_header = ''.join(remaining_parts)
 
-            # Search in the remaining header to avoid double-matching the same text.
-            matches = list(re.finditer(pattern, remaining_header))
-            for match in matches:
-                template = match.group()
-                templates_above_tags.append((qid, template))
-                # Remove this specific occurrence from the header.
-                remaining_header = remaining_header.replace(template, '', 1)
+        # Sort by QID priority; templates of the same QID keep their order in the header.
+        templates.sort(key=lambda template: self.layout_priority[template[0]])
 
         # Construct the string of sorted templates
-        sorted_templates = [f"{item[1].rstrip()}\n" for item in templates_above_tags]
-        sorted_templates_str = ''.join(sorted_templates) if sorted_templates else ''
+        sorted_templates_str = ''.join(f"{header[start:end].rstrip()}\n" for qid, start, end in templates)
 
         # Return both sorted templates string and remaining header
         return sorted_templates_str, remaining_header
     
-    def _create_tag_regex(self, tag_name: str) -> re.Pattern | None:
-        """Create a compiled regex to find a tag and its redirects."""
-        all_titles = self.tag_redirects.get(tag_name)
-        if not all_titles:
-            return None
-        
-        pattern_str = r"\{\{(" + "|".join(
-            self.case_insensitive_first_letter(tag) for tag in all_titles
-        ) + r")(?:\s*\|.*?)*?\s*\}\}"
+    def find_layout_templates(self, text):
+        """
+        Yield (qid, start, end) for each layout template in the text, in order of appearance.
+        The name of each template is looked up in a dict, and the end of a template is found by
+        counting nested braces with str.find, so the scan stays linear in the length of the text
+        however many layout templates and redirects there are, and however deeply they are nested.
+        """
+        position = 0
+        while (start := text.find('{{', position)) != -1:
+            match = TEMPLATE_NAME_REGEX.match(text, start)
+            qid = match and self.layout_qid_by_name.get(title_key(match.group(1)))
+            if not qid:
+                # Not a layout template, but one may be nested inside it.
+                position = start + 2
+                continue
+            depth = 1
+            index = match.end()
+            while depth:
+                next_close = text.find('}}', index)
+                if next_close == -1:
+                    # No template can be closed anywhere after this point.
+                    return
+                next_open = text.find('{{', index, next_close)
+                if next_open != -1:
+                    depth += 1
+                    index = next_open + 2
+                else:
+                    depth -= 1
+                    index = next_close + 2
+            # Include the line break after the template.
+            if text.startswith('\n', index):
+                index += 1
+            yield qid, start, index
+            position = index
+
+    def _create_tag_regex(self, titles_pattern: str) -> re.Pattern:
+        """Create a compiled regex to find any of the titles in the given alternation."""
+        pattern_str = r"\{\{(" + titles_pattern + r")(?:\s*\|.*?)*?\s*\}\}"
         return re.compile(pattern_str, re.IGNORECASE)
 
+
     def _get_tag_sort_key(self, tag_wikitext):
         """Find the index of a tag's canonical name in the master sort list."""
-        for index, canonical_name in enumerate(self.tag_order):
-            regex = self._create_tag_regex(canonical_name)
-            # If a regex exists and it matches, return its priority (index).
-            if regex and regex.search(tag_wikitext):
-                return index
         # If the tag is not in our list, send it to the end.
-        return len(self.tag_order)
+        return TAG_PRIORITY_INDEX.get(self._get_canonical_tag_name(tag_wikitext), len(TAG_PRIORITY_INDEX))
+
+    def _get_canonical_tag_name(self, tag_wikitext):
+        """Return the canonical name of a tag from its wikitext, or None if it is not a known tag."""
+        if match := TEMPLATE_NAME_REGEX.match(tag_wikitext):
+            # Get the template name (e.g., "Orphaned") and look it up.
+            return self.redirect_to_canonical.get(title_key(match.group(1)))
+        return None
     
     # =========================================================================
     # Edit Summary Generation
@@ -608,6 +765,50 @@ class TagBot(
     # API & Setup Helpers
     # =========================================================================
     
+    def _load_template_data(self, qids):
+        """
+        Return the titles of the given QIDs on this wiki, and the redirects of
+        the templates among them. The data is read from the on-disk cache if it
+        is still fresh, otherwise it is fetched and the cache is refreshed.
+        """
+        cache_file = os.path.join(pywikibot.config.base_dir, f'tag_cache_{self.site.dbName()}.json')
+        qids = sorted(qids)
+
+        try:
+            with open(cache_file, encoding='utf-8') as f:
+                cache = json.load(f)
+            # The cache is only valid for the same data format and the same set of QIDs from tag_data.py.
+            if (cache['version'] == TEMPLATE_CACHE_VERSION and cache['qids'] == qids
+                    and time.time() - cache['timestamp'] < TEMPLATE_CACHE_TTL):
+                pywikibot.info("Using cached template data.")
+                return cache['titles'], cache['redirects']
+        except (OSError, ValueError, KeyError):
+            pass  # No usable cache, fetch the data below.
+
+        # Fetch all titles from Wikidata in a single, efficient API call.
+        all_titles = self._fetch_titles_from_wikidata(qids, self.site.code)
+
+        # Fetch redirects for all templates (everything but the "Living people" category) at once.
+        template_titles = [title for qid, title in all_titles.items() if qid != LIVING_PEOPLE_CATEGORY_QID]
+        redirects_by_title = self._fetch_redirects_with_progress(template_titles, "Fetching template redirects")
+
+        # Don't cache the result of a failed Wikidata request.
+        if all_titles:
+            cache = {
+                'version': TEMPLATE_CACHE_VERSION,
+                'qids': qids,
+                'timestamp': time.time(),
+                'titles': all_titles,
+                'redirects': redirects_by_title,
+            }
+            try:
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f, ensure_ascii=False)
+            except OSError as e:
+                pywikibot.warning(f"Could not write the template cache: {e}")
+
+        return all_titles, redirects_by_title
+
     def _fetch_titles_from_wikidata(self, qids, language):
         """
         Fetch sitelinks for a list of Wikidata QIDs in a single API call.
@@ -638,67 +839,81 @@ class TagBot(
                 results[qid] = title.split(':', 1)[-1]  # Remove namespace
         return results
     
-    def _get_template_redirects(self, site, template_title):
-            """Get a list of redirect titles for a given template."""
-            page = pywikibot.Page(site, template_title, ns=10)
-            redirects = page.redirects(filter_fragments=False, namespaces=10)
-            return [redirect.title(with_ns=False) for redirect in redirects]
-
-    def _fetch_redirects_with_progress(self, titles, processed_items, total, status):
+    def _fetch_redirects_batch(self, batch):
         """
-        Generic helper to fetch all redirects for a list of template titles
-        and update the progress bar. Returns a flat list of all unique titles
-        (originals + redirects) and the updated progress count.
+        Fetch all redirects for up to 50 template titles with one API request
+        (prop=redirects). Returns a dictionary mapping each title to a list of
+        all unique titles (original + redirects).
         """
-        all_redirects = []
-        for title in titles:
-            if title:  # Ensure title is not None
-                redirects = self._get_template_redirects(self.site, title)
-                all_redirects.extend([title] + redirects)
-            processed_items += 1
-            self._update_progress(processed_items, total, status)
-        return list(set(all_redirects)), processed_items
-
-    def _process_layout_templates(self, layout_titles_by_qid, processed_items, total_items):
+        # Map the full titles returned by the API back to the titles without namespace.
+        batch_by_full_title = {pywikibot.Page(self.site, title, ns=10).title(): title for title in batch}
+        redirects = {title: [title] for title in batch}
+
+        parameters = {
+            'action': 'query',
+            'prop': 'redirects',
+            'titles': '|'.join(batch_by_full_title),
+            'rdnamespace': 10,
+            'rdprop': 'title',
+            'rdlimit': 'max',
+            'formatversion': 2,
+        }
+        while True:
+            data = self.site.simple_request(**parameters).submit()
+            for page_data in data.get('query', {}).get('pages', []):
+                title = batch_by_full_title.get(page_data['title'])
+                if title:
+                    redirects[title].extend(redirect['title'].split(':', 1)[-1]  # Remove namespace
+                                            for redirect in page_data.get('redirects', []))
+            # Follow the continuation for templates with more redirects than one response holds.
+            if 'continue' not in data:
+                break
+            parameters.update(data['continue'])
+
+        return {title: list(dict.fromkeys(all_titles)) for title, all_titles in redirects.items()}
+
+    def _fetch_redirects_with_progress(self, titles, status):
         """
-        Takes a pre-fetched dictionary of QIDs to layout titles, fetches
-        their redirects, and builds the regex patterns needed for sorting.
+        Fetch all redirects for a list of template titles in batches of 50,
+        with the batches requested concurrently, and update the progress bar
+        as each batch completes. Returns a dictionary mapping each title to a
+        list of all unique titles (original + redirects).
         """
+        titles = list(dict.fromkeys(title for title in titles if title))  # Skip missing (None) titles
+        batches = [titles[start:start + 50] for start in range(0, len(titles), 50)]
         results = {}
-        for qid, title in layout_titles_by_qid.items():
-            redirects, processed_items = self._fetch_redirects_with_progress(
-                [title], processed_items, total_items, "Fetching layout redirects")
-            results[qid] = redirects
+        # The requests are independent and I/O bound, so overlap their round trips.
+        with ThreadPoolExecutor(max_workers=MAX_INIT_WORKERS) as executor:
+            for batch_results in executor.map(self._fetch_redirects_batch, batches):
+                results.update(batch_results)
+                self._update_progress(len(results), len(titles), status)
+        return results
+
+    def _process_layout_templates(self, layout_titles_by_qid, redirects_by_title):
+        """
+        Takes a pre-fetched dictionary of QIDs to layout titles and their
+        redirects, and builds the lookups needed for sorting.
+        """
+        results = {qid: redirects_by_title[title] for qid, title in layout_titles_by_qid.items()}
 
-        # Generate the pattern for each QID.
-        patterns = {}
+        # Map every lowercased title and redirect to its QID. QIDs are visited in priority order,
+        # so a title shared by several of them belongs to the one with the highest priority.
+        self.layout_qid_by_name = {}
         for qid, templates in results.items():
-            template_titles = "|".join(self.case_insensitive_first_letter(template) for template in templates)
-            pattern = r"(?ms)\{\{(?:" + template_titles + r")\s*\|?(?:\{\{.*?\}\}|[^\{\}])*\}\}\n?"
-            patterns[qid] = pattern
+            for template in templates:
+                self.layout_qid_by_name.setdefault(template.lower(), qid)
 
-        self.qid_patterns = patterns
-        return results, processed_items
+        self.layout_priority = {qid: index for index, qid in enumerate(results)}
+        return results
     
     # =========================================================================
     # Utility Helpers
     # =========================================================================
     
     def get_tag_config(self, tag_name):
-        """Get the effective tag configuration by merging site-specific overrides
-        with the default configuration from the unified TAG_DEFINITIONS."""
-        # Start with a copy of the default settings for the tag
-        defaults = TAG_DEFINITIONS.get('default', {}).get(tag_name, {})
-        config = defaults.copy()
-
-        # Get the dictionary of overrides for the current site's language
-        site_overrides = TAG_DEFINITIONS.get(self.site.code, {})
-
-        # If there are specific overrides for this tag on this site, apply them
-        if tag_name in site_overrides:
-            config.update(site_overrides[tag_name])
-            
-        return config
+        """Get the effective tag configuration, with the site-specific overrides
+        from the unified TAG_DEFINITIONS already merged into the defaults."""
+        return self.tag_configs.get(tag_name, {})
     
     def is_page_eligible_for_edit(self, page):
         if page.namespace() != 0:
@@ -711,29 +926,41 @@ class TagBot(
         
         return True
 
-    def case_insensitive_first_letter(self, tag):
-        """Return a regex pattern for the tag with case-insensitive first letter."""
-        if tag and tag[0] in string.ascii_letters:
-            return "[" + tag[0].upper() + tag[0].lower() + "]" + re.escape(tag[1:])
-        else:
-            return re.escape(tag)
-        
     def _update_progress(self, count, total, status=''):
         """Display a simple text-based progress bar."""
-        bar_len = 40
-        filled_len = int(bar_len * count / total)
+        # Only draw on a terminal; redirected output would just collect the redraws.
+        if not sys.stdout.isatty():
+            return
 
         # Use integer percentage for a cleaner look.
-        percents = int(100 * count / total)
-        bar = '=' * filled_len + '-' * (bar_len - filled_len)
+        percents = count * 100 // total
+
+        # Skip redraws that change nothing visible, at most ~20 per second, but always draw the last one.
+        now = time.monotonic()
+        if (count < total and percents == self._last_progress_pct
+                and now - self._last_progress_time < 0.05):
+            return
+        self._last_progress_pct = percents
+        self._last_progress_time = now
+
+        filled_len = count * PROGRESS_BAR_LEN // total
+        bar = PROGRESS_BAR_FILLED[:filled_len] + PROGRESS_BAR_EMPTY[filled_len:]
 
         # Build the output string first.
         output_str = f'[{bar}] {percents:3}% {status}...'
         
-        # Pad to fixed width (e.g. 100) to overwrite old text, then return cursor.
-        sys.stdout.write(output_str.ljust(100) + '\r')
+        # Erase the old text with an ANSI escape instead of padding, then return cursor.
+        sys.stdout.write(f'\x1b[2K{output_str}\r')
         sys.stdout.flush()
 
+def preload_with_pageprops(generator, groupsize=50):
+    """
+    Preload the pages of a generator in batches, like pagegenerators.PreloadingGenerator,
+    but with their page properties too, so page.isDisambig() doesn't query each page again.
+    """
+    while group := list(islice(generator, groupsize)):
+        yield from group[0].site.preloadpages(group, groupsize=groupsize, pageprops=True)
+
 def main(*args: str) -> None:
     """
     Process command line arguments and invoke bot.
@@ -767,9 +994,11 @@ def main(*args: str) -> None:
         else:
             options[option] = True
 
-    # The preloading option is responsible for downloading multiple
+    # The preloading is responsible for downloading multiple
     # pages from the wiki simultaneously.
-    gen = gen_factory.getCombinedGenerator(preload=True)
+    gen = gen_factory.getCombinedGenerator()
+    if gen:
+        gen = preload_with_pageprops(gen)
 
     # check if further help is needed
     if not pywikibot.bot.suggest_help(missing_generator=not gen):
@@ -143,7 +143,6 @@ LAYOUT_TEMPLATES_BY_PRIORITY = [
     'Q13218913', # Template:Db-negublp
     'Q11460470', # Template:Db-g11
     'Q10989772', # Template:Db-g12
-    'Q10989772', # Template:Db-g12
     'Q13218935', # Template:Db-g14
     'Q12470007', # Template:Db-a1
     'Q12470008', # Template:Db-a2
@@ -173,7 +172,6 @@ LAYOUT_TEMPLATES_BY_PRIORITY = [
     'Q14441546', # Template:Pp-move-dispute
     'Q25976532', # Template:Pp-extended
     'Q9039502', # Template:Pp-semi-indef
-    'Q7482910', # Template:Pp-move
     'Q9039353', # Template:Pp-sock
     'Q6704722', # Template:Pp-vandalism
     'Q13566056', # Template:Pp-move-vandalism
@@ -283,4 +281,7 @@ ALL_TAGS_BY_PRIORITY = {
     "cleanup_school": "Q7639994",
     "directory": "Q19753394",
     "underlinked": "Q13107723",
-}
\ No newline at end of file
+}
+
+# Sort position of each tag inside {{Multiple issues}}, derived from the order above.
+TAG_PRIORITY_INDEX = {name: index for index, name in enumerate(ALL_TAGS_BY_PRIORITY)}
@@ -15,23 +15,26 @@ and other related functionalities.
 # Version: 1.0
 #
 
+__all__ = ['convert_numerals', 'format_date']
+
+# Translation table from Western to Eastern Arabic numerals
+EASTERN_ARABIC_NUMERALS = str.maketrans('0123456789', '٠١٢٣٤٥٦٧٨٩')
+
 # A function to convert numerals to Eastern Arabic numerals
 def convert_numerals(text):
-    eastern_arabic_numerals = {
-        '0': '٠', '1': '١', '2': '٢', '3': '٣', '4': '٤', '5': '٥', '6': '٦', '7': '٧', '8': '٨', '9': '٩'
-    }
-    return ''.join(eastern_arabic_numerals[char] if char in eastern_arabic_numerals else char for char in text)
+    return text.translate(EASTERN_ARABIC_NUMERALS)
 
-# A function to format a date with the Central Kurdish Wikipedia (ckbwiki) desired format and optional link
-def format_date(date, link=None):
-    months = {
-        'January': 'کانوونی دووەم', 'February': 'شوبات', 'March': 'ئازار', 'April': 'نیسان', 'May': 'ئایار', 'June': 'حوزەیران',
-        'July': 'تەممووز', 'August': 'ئاب', 'September': 'ئەیلوول', 'October': 'تشرینی یەکەم', 'November': 'تشرینی دووەم', 'December': 'کانوونی یەکەم'
-    }
+# Central Kurdish month names, indexed by month number - 1
+KURDISH_MONTHS = (
+    'کانوونی دووەم', 'شوبات', 'ئازار', 'نیسان', 'ئایار', 'حوزەیران',
+    'تەممووز', 'ئاب', 'ئەیلوول', 'تشرینی یەکەم', 'تشرینی دووەم', 'کانوونی یەکەم'
+)
 
-    date_parts = date.split()
-    formatted_date = f'{convert_numerals(date_parts[2])}ی {months[date_parts[1]]}ی {convert_numerals(date_parts[0])}'
+# A function to format a date (date or datetime) with the Central Kurdish Wikipedia (ckbwiki) desired format and optional link
+def format_date(date, link=None):
+    # Month names contain no digits, so the numerals can be converted in one pass over the whole string
+    formatted_date = f'{date.day}ی {KURDISH_MONTHS[date.month - 1]}ی {date.year}'.translate(EASTERN_ARABIC_NUMERALS)
     if link:
         return f'[[{link}|{formatted_date}]]'
     else:
-        return formatted_date
\ No newline at end of file
+        return formatted_date